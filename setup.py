@@ -16,7 +16,7 @@ setup(
     packages=find_packages(),
     include_package_data=True,
     package_data={
-        'zxcvbn': ['locale/*/LC_MESSAGES/*.mo'],
+        'zxcvbn': ['locale/*/LC_MESSAGES/*.mo', 'data/*.txt'],
     },
     url='https://github.com/dwolfhub/zxcvbn-python',
     download_url='https://github.com/dwolfhub/zxcvbn-python/tarball/v4.5.0',
@@ -25,6 +25,9 @@ setup(
     author_email='danielrwolf5@gmail.com',
     long_description=long_description,
     keywords=['zxcvbn', 'password', 'security'],
+    extras_require={
+        'ahocorasick': ['pyahocorasick'],
+    },
     entry_points={
         'console_scripts': [
             'zxcvbn = zxcvbn.__main__:cli'
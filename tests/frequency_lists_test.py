@@ -1,5 +1,7 @@
-from unittest import TestCase
+import importlib
+from unittest import TestCase, mock
 
+from zxcvbn import frequency_lists
 from zxcvbn.frequency_lists import FREQUENCY_LISTS
 
 
@@ -11,4 +13,23 @@ class TestRankedDictionaries(TestCase):
         assert 'female_names' in FREQUENCY_LISTS
         assert 'surnames' in FREQUENCY_LISTS
         assert 'us_tv_and_film' in FREQUENCY_LISTS
-        assert 'male_names' in FREQUENCY_LISTS
\ No newline at end of file
+        assert 'male_names' in FREQUENCY_LISTS
+
+    def test_loaded_lazily_once(self):
+        # a fresh import doesn't read the lists until they're first used
+        importlib.reload(frequency_lists)
+        assert frequency_lists._FREQUENCY_LISTS is None
+
+        with mock.patch.object(frequency_lists, 'load_frequency_list',
+                               wraps=frequency_lists.load_frequency_list) \
+                as load_frequency_list:
+            assert not load_frequency_list.called
+            lists = frequency_lists.FREQUENCY_LISTS
+            assert load_frequency_list.call_count == \
+                len(frequency_lists.FREQUENCY_LIST_NAMES)
+            assert frequency_lists.FREQUENCY_LISTS is lists
+            assert load_frequency_list.call_count == \
+                len(frequency_lists.FREQUENCY_LIST_NAMES)
+
+        with self.assertRaises(AttributeError):
+            frequency_lists.NOT_A_LIST
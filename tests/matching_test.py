@@ -1,3 +1,4 @@
+import pytest
 from unittest import TestCase
 
 from zxcvbn import adjacency_graphs
@@ -174,6 +175,47 @@ def test_dictionary_matching():
     })
 
 
+def test_dictionary_matching_automaton():
+    # with pyahocorasick installed the default dictionaries are matched
+    # through an automaton; copies of them always take the substring scan.
+    # both must find the same words.
+    pytest.importorskip('ahocorasick')
+
+    ranked_dictionaries = matching.get_ranked_dictionaries()
+    for name, ranked_dict in ranked_dictionaries.items():
+        assert matching.get_automaton(name, ranked_dict) is not None
+    copied_dicts = {name: dict(ranked_dict) for name, ranked_dict in
+                    ranked_dictionaries.items()}
+
+    passwords = [
+        'correcthorsebatterystaple1990',
+        'p4ssw0rdcorrect',
+        'Tr0ub4dour&3',
+        'JohnSmith123',
+        'qwertyuiop',
+        'iloveyou!!',
+        '1q2w3e4r5t',
+        'd0gs4r3gr8',
+        'zxcvbn',
+        'a',
+        '',
+    ]
+    passwords += [word + '2024' for word in
+                  list(ranked_dictionaries['passwords'])[:100]]
+    passwords += [matching.translate(word, {'a': '4', 'e': '3', 'o': '0'})
+                  for word in list(ranked_dictionaries['surnames'])[:100]]
+
+    for password in passwords:
+        assert matching.dictionary_match(password) == \
+            matching.dictionary_match(password,
+                                      _ranked_dictionaries=copied_dicts), \
+            password
+        assert matching.l33t_match(password) == \
+            matching.l33t_match(password,
+                                _ranked_dictionaries=copied_dicts), \
+            password
+
+
 def test_reverse_dictionary_matching():
     test_dicts = {
         'd1': {
@@ -579,3 +621,33 @@ def test_omnimatch():
             password, pattern_name, i, j
         )
         assert included, msg
+
+
+def test_omnimatch_user_inputs():
+    password = 'johnjohnjohn'
+
+    def user_input_matches(matches):
+        return [match for match in matches
+                if match.get('dictionary_name') == 'user_inputs']
+
+    matches = matching.omnimatch(password, user_inputs=['john'])
+    msg = "matches user inputs"
+    assert user_input_matches(matches), msg
+
+    repeat = [match for match in matches if match['pattern'] == 'repeat'][0]
+    msg = "matches user inputs in the base token of repeats"
+    assert user_input_matches(repeat['base_matches']), msg
+
+    msg = "doesn't keep user inputs for later calls"
+    assert 'user_inputs' not in matching.get_ranked_dictionaries(), msg
+    assert not user_input_matches(matching.omnimatch(password)), msg
+
+
+def test_omnimatch_user_inputs_dont_modify_dictionaries():
+    test_dicts = {'d1': {'abc': 1}}
+    matches = matching.omnimatch('abcxyz', _ranked_dictionaries=test_dicts,
+                                 user_inputs=['xyz'])
+    msg = "matches user inputs without adding them to the passed dictionaries"
+    assert [match['dictionary_name'] for match in matches
+            if match['pattern'] == 'dictionary'] == ['d1', 'user_inputs'], msg
+    assert test_dicts == {'d1': {'abc': 1}}, msg
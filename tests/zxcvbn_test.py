@@ -1,6 +1,8 @@
 # -*- coding: utf-8 -*-
 import pytest
-from zxcvbn import zxcvbn
+import gettext
+from unittest import mock
+from zxcvbn import zxcvbn, feedback, translation, clear_cache
 
 
 def test_unicode_user_inputs():
@@ -69,3 +71,96 @@ def test_chinese_language_support():
     assert result["feedback"]["warning"] == \
            "A word by itself is easy to guess.", \
            "Falls back to English for unsupported languages"
+
+
+def test_language_aliases():
+    # aliases of the same catalog don't re-install the translation
+    zxcvbn("musculature", lang='zh')
+    installed = feedback._.__self__
+    for lang in ('zh_CN', 'zh-Hans', 'zh_Hans_CN'):
+        result = zxcvbn("musculature", lang=lang)
+        assert result["feedback"]["warning"] == "单个词语容易被猜中。"
+        assert feedback._.__self__ is installed
+
+    zxcvbn("musculature", lang='en')
+    installed = feedback._.__self__
+    zxcvbn("musculature", lang='')
+    assert feedback._.__self__ is installed
+
+
+def test_english_skips_catalog_lookup():
+    with mock.patch('gettext.translation') as translation:
+        for lang in ('en', 'en_US', 'en-us', ''):
+            result = zxcvbn("musculature", lang=lang)
+            assert result["feedback"]["warning"] == \
+                   "A word by itself is easy to guess."
+
+    assert not translation.called
+
+
+def test_junk_languages_dont_evict_catalogs():
+    with mock.patch.dict(translation._TRANSLATION_CACHE, clear=True):
+        for i in range(translation._TRANSLATION_CACHE_SIZE + 1):
+            zxcvbn("musculature", lang='xx%d' % i)
+
+        with mock.patch('gettext.translation',
+                        wraps=gettext.translation) as find:
+            zxcvbn("musculature", lang='zh_CN')
+            installed = feedback._.__self__
+            for _ in range(5):
+                result = zxcvbn("musculature", lang='zh_CN')
+                assert result["feedback"]["warning"] == "单个词语容易被猜中。"
+                assert feedback._.__self__ is installed
+
+        assert find.call_count == 1
+
+
+def test_cache():
+    password = "JohnSmith123"
+    user_inputs = ['John', 'Smith']
+
+    expected = zxcvbn(password, user_inputs=user_inputs)
+    result = zxcvbn(password, user_inputs=user_inputs, cache=True)
+    cached = zxcvbn(password, user_inputs=user_inputs, cache=True)
+
+    for res in [result, cached]:
+        assert res['guesses'] == expected['guesses']
+        assert res['sequence'] == expected['sequence']
+        assert res['feedback'] == expected['feedback']
+
+    result['feedback']['suggestions'].append('changed')
+    assert zxcvbn(password, user_inputs=user_inputs, cache=True)['feedback'] \
+        == expected['feedback'], "callers can't change cached results"
+
+
+def test_cache_switching_languages():
+    password = "musculature"
+    english = "A word by itself is easy to guess."
+    chinese = "单个词语容易被猜中。"
+    clear_cache()
+
+    for lang, warning in [('zh_CN', chinese), ('en', english),
+                          ('zh_CN', chinese), ('en', english)]:
+        result = zxcvbn(password, lang=lang, cache=True)
+        assert result["feedback"]["warning"] == warning
+
+    # another thread installing English while a Chinese result is being
+    # cached must not leave English feedback in the cache
+    clear_cache()
+    zxcvbn(password, lang='en')
+    with mock.patch('zxcvbn.setup_translation'):
+        zxcvbn(password, lang='zh_CN', cache=True)
+    result = zxcvbn(password, lang='zh_CN', cache=True)
+    assert result["feedback"]["warning"] == chinese
+
+
+def test_max_length_checked_first():
+    # oversized passwords are rejected before any translation or matching
+    # work is done
+    with mock.patch('zxcvbn.setup_translation') as setup_translation, \
+            mock.patch('zxcvbn.matching.omnimatch') as omnimatch:
+        with pytest.raises(ValueError):
+            zxcvbn("a" * 73, lang='zh')
+
+    assert not setup_translation.called
+    assert not omnimatch.called
@@ -1,8 +1,17 @@
-import os
-import gettext
-from datetime import datetime
+import copy
+import time
+import functools
+import threading
 
 from . import matching, scoring, time_estimates, feedback
+from .translation import get_translation
+
+# user inputs of other types are converted with str()
+_STR_TYPES = (str, bytes)
+
+# The translation currently installed by setup_translation()
+_INSTALLED_TRANSLATION = None
+_INSTALL_LOCK = threading.Lock()
 
 def setup_translation(lang_code='en'):
     """Setup translation function _() for the given language code.
@@ -10,81 +19,75 @@ def setup_translation(lang_code='en'):
     Args:
         lang_code (str): Language code (e.g. 'en', 'zh_CN'). Defaults to 'en'.
     """
-    global _  # Make _ available globally
-    
-    LOCALE_DIR = os.path.join(os.path.dirname(__file__), 'locale')
-    DOMAIN = 'messages'
-    languages_to_try = []
-
-    # 1. Core logic for implementing locale aliasing
-    if lang_code.lower().startswith('zh'):
-        # For any Chinese variants, build a fallback chain
-        # For example, if lang_code is 'zh', the list will be ['zh', 'zh_CN']
-        # If lang_code is 'zh_Hans_CN', list will be ['zh_Hans_CN', 'zh_CN']
-        # gettext will first look for 'zh_Hans_CN', then fall back to 'zh_CN'
-        languages_to_try = [lang_code, 'zh_CN', 'zh']
-        # Remove duplicates while preserving order
-        languages_to_try = sorted(set(languages_to_try), key=languages_to_try.index)
-    else:
-        # For other languages, use directly
-        languages_to_try = [lang_code]
-
-    print(f"Attempting to load translations for '{lang_code}'. Search path: {languages_to_try}")
-
-    try:
-        # 2. Pass our constructed language list to gettext
-        translation = gettext.translation(
-            DOMAIN,
-            localedir=LOCALE_DIR,
-            languages=languages_to_try,
-            fallback=True # fallback=True ensures no exception if all languages not found
-        )
-        
-        # 3. Install translation function _() globally
+    global _INSTALLED_TRANSLATION
+
+    # never raises, languages without a catalog get a shared
+    # NullTranslations
+    translation = get_translation(lang_code)
+
+    # Checked without the lock first, so concurrent calls for the active
+    # language (the common case) don't serialize on it.
+    if translation is _INSTALLED_TRANSLATION:
+        return
+
+    with _INSTALL_LOCK:
+        if translation is _INSTALLED_TRANSLATION:
+            return
+
+        # Install translation function _() globally
         translation.install()
-        print(f"Successfully loaded translation: {translation.info().get('language')}")
+        feedback._ = translation.gettext
+        # published last, once feedback._ is in place for lock-free readers
+        _INSTALLED_TRANSLATION = translation
+
+def _evaluate(password, user_inputs):
+    start = time.perf_counter()
+
+    matches = matching.omnimatch(password, user_inputs=user_inputs)
+    result = scoring.most_guessable_match_sequence(password, matches)
+    result['calc_time'] = time.perf_counter() - start
 
-    except FileNotFoundError:
-        # If even fallback language is not found, use default gettext (no translation)
-        print("No suitable translation found. Falling back to original strings.")
-        _ = gettext.gettext
+    attack_times = time_estimates.estimate_attack_times(result['guesses'])
+    result.update(attack_times)
+
+    return result
 
-    from .feedback import get_feedback as _get_feedback
-    from . import feedback
-    feedback._ = _
+@functools.lru_cache(maxsize=1024)
+def _evaluate_cached(password, user_inputs):
+    return _evaluate(password, list(user_inputs))
 
-def zxcvbn(password, user_inputs=None, max_length=72, lang='en'):
+def clear_cache():
+    """Drop the results remembered by zxcvbn(..., cache=True)."""
+    _evaluate_cached.cache_clear()
+
+def zxcvbn(password, user_inputs=None, max_length=72, lang='en', cache=False):
     # Throw error if password exceeds max length
     if len(password) > max_length:
         raise ValueError(f"Password exceeds max length of {max_length} characters.")
     setup_translation(lang)
 
-    try:
-        # Python 2 string types
-        basestring = (str, unicode)
-    except NameError:
-        # Python 3 string types
-        basestring = (str, bytes)
-
     if user_inputs is None:
         user_inputs = []
 
-    start = datetime.now()
-
     sanitized_inputs = []
     for arg in user_inputs:
-        if not isinstance(arg, basestring):
+        # plain str is by far the common case, skip the isinstance() check
+        if type(arg) is not str and not isinstance(arg, _STR_TYPES):
             arg = str(arg)
         sanitized_inputs.append(arg.lower())
 
-    matches = matching.omnimatch(password, user_inputs=sanitized_inputs)
-    result = scoring.most_guessable_match_sequence(password, matches)
-    result['calc_time'] = datetime.now() - start
-
-    attack_times = time_estimates.estimate_attack_times(result['guesses'])
-    for prop, val in attack_times.items():
-        result[prop] = val
-
+    if not cache:
+        result = _evaluate(password, sanitized_inputs)
+    else:
+        # identical calls (e.g. re-validating a form) reuse the first result;
+        # callers get their own copy so they can't alter the cached one.
+        start = time.perf_counter()
+        result = copy.deepcopy(
+            _evaluate_cached(password, tuple(sanitized_inputs)))
+        result['calc_time'] = time.perf_counter() - start
+
+    # Rendered per call and never cached: the messages go through the
+    # process-wide _(), which another thread may switch to its own language.
     result['feedback'] = feedback.get_feedback(result['score'],
                                                result['sequence'])
 
@@ -1,34 +1,109 @@
 from zxcvbn import scoring
 from . import adjacency_graphs
 import re
+import collections
 import functools
+import threading
+from operator import itemgetter
+
+try:
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
 
 from zxcvbn.scoring import most_guessable_match_sequence
 
 
 def build_ranked_dict(ordered_list):
-    return {word: idx for idx, word in enumerate(ordered_list, 1)}
+    return dict(zip(ordered_list, range(1, len(ordered_list) + 1)))
+
 
 RANKED_DICTIONARIES = None
+RANKED_DICTIONARIES_LOCK = threading.Lock()
+
+
+def build_ranked_dictionaries():
+    """Build {dictionary_name: {word: rank}} from frequency_lists."""
+    # Do the expensive import here only
+    from zxcvbn.frequency_lists import FREQUENCY_LISTS
+
+    return {name: build_ranked_dict(lst)
+            for name, lst in FREQUENCY_LISTS.items()}
+
 
 def get_ranked_dictionaries():
     """
     Lazy-load large dictionary data set.
-    Return global _RANKED_DICTIONARIES, ensuring it is built only once.
+    Return global RANKED_DICTIONARIES, ensuring it is built only once.
     """
     global RANKED_DICTIONARIES
 
     if RANKED_DICTIONARIES is None:
-        # Do the expensive import here only
-        from zxcvbn.frequency_lists import FREQUENCY_LISTS
-
-        # Build the dictionary once
-        RANKED_DICTIONARIES = {}
-        for name, lst in FREQUENCY_LISTS.items():
-          RANKED_DICTIONARIES[name] = build_ranked_dict(lst)
+        # double-checked so concurrent first calls load the data only once
+        with RANKED_DICTIONARIES_LOCK:
+            if RANKED_DICTIONARIES is None:
+                RANKED_DICTIONARIES = build_ranked_dictionaries()
     return RANKED_DICTIONARIES
 
 
+def is_shared_dictionary(dictionary_name, ranked_dict):
+    """Whether ranked_dict is one of the (never mutated) RANKED_DICTIONARIES."""
+    return RANKED_DICTIONARIES is not None and \
+        RANKED_DICTIONARIES.get(dictionary_name) is ranked_dict
+
+
+# {dictionary_name: (ranked_dict, max_word_length)}, see get_max_word_length()
+MAX_WORD_LENGTHS: dict = {}
+
+
+def get_max_word_length(dictionary_name, ranked_dict):
+    """
+    Return the length of the longest word in ranked_dict, or None.
+
+    Longer substrings can't match, so dictionary_match doesn't look them up.
+    The length is only computed (once) for the shared RANKED_DICTIONARIES.
+    Other dictionaries may be new on every call, where walking all their
+    words would cost more than the lookups it saves, so they aren't bounded.
+    """
+    if not is_shared_dictionary(dictionary_name, ranked_dict):
+        return None
+
+    cached = MAX_WORD_LENGTHS.get(dictionary_name)
+    if cached is None or cached[0] is not ranked_dict:
+        cached = MAX_WORD_LENGTHS[dictionary_name] = (
+            ranked_dict, max(map(len, ranked_dict), default=0))
+
+    return cached[1]
+
+
+# {dictionary_name: (ranked_dict, automaton)}, see get_automaton()
+AUTOMATONS: dict = {}
+
+
+def get_automaton(dictionary_name, ranked_dict):
+    """
+    Return an Aho-Corasick automaton over the words of ranked_dict, or None.
+
+    Automatons are only compiled (once) for the shared RANKED_DICTIONARIES and
+    only when the optional pyahocorasick package is installed. Other
+    dictionaries are matched with the plain substring scan.
+    """
+    if ahocorasick is None or \
+            not is_shared_dictionary(dictionary_name, ranked_dict):
+        return None
+
+    cached = AUTOMATONS.get(dictionary_name)
+    if cached is None or cached[0] is not ranked_dict:
+        automaton = ahocorasick.Automaton()
+        for word, rank in ranked_dict.items():
+            if word:
+                automaton.add_word(word, (word, rank))
+        automaton.make_automaton()
+        cached = AUTOMATONS[dictionary_name] = (ranked_dict, automaton)
+
+    return cached[1]
+
+
 def ensure_ranked_dictionaries(func):
     """Decorator to ensure _ranked_dictionaries argument is always populated."""
     @functools.wraps(func)
@@ -99,7 +174,11 @@ DATE_SPLITS = {
 @ensure_ranked_dictionaries
 def omnimatch(password, _ranked_dictionaries=None, user_inputs=[]):
     if len(user_inputs):
-        _ranked_dictionaries['user_inputs'] = build_ranked_dict(user_inputs)
+        # layer the user inputs over the shared dictionaries rather than
+        # adding them: those are never modified, so concurrent and later
+        # calls don't see these inputs, and nothing is copied.
+        _ranked_dictionaries = collections.ChainMap(
+            {'user_inputs': build_ranked_dict(user_inputs)}, _ranked_dictionaries)
 
     matches = []
     for matcher in [
@@ -114,7 +193,7 @@ def omnimatch(password, _ranked_dictionaries=None, user_inputs=[]):
     ]:
         matches.extend(matcher(password, _ranked_dictionaries=_ranked_dictionaries))
 
-    return sorted(matches, key=lambda x: (x['i'], x['j']))
+    return sorted(matches, key=itemgetter('i', 'j'))
 
 
 # dictionary match (common passwords, english, last names, etc)
@@ -124,24 +203,36 @@ def dictionary_match(password, _ranked_dictionaries=None):
     length = len(password)
     password_lower = password.lower()
     for dictionary_name, ranked_dict in _ranked_dictionaries.items():
-        for i in range(length):
-            for j in range(i, length):
-                if password_lower[i:j + 1] in ranked_dict:
-                    word = password_lower[i:j + 1]
-                    rank = ranked_dict[word]
-                    matches.append({
-                        'pattern': 'dictionary',
-                        'i': i,
-                        'j': j,
-                        'token': password[i:j + 1],
-                        'matched_word': word,
-                        'rank': rank,
-                        'dictionary_name': dictionary_name,
-                        'reversed': False,
-                        'l33t': False,
-                    })
+        automaton = get_automaton(dictionary_name, ranked_dict)
+        if automaton is not None:
+            # single pass over the password for all words of the dictionary
+            found = [(j - len(word) + 1, j, word, rank)
+                     for j, (word, rank) in automaton.iter(password_lower)]
+        else:
+            max_word_length = get_max_word_length(dictionary_name,
+                                                  ranked_dict)
+            if max_word_length is None:
+                max_word_length = length
+            found = [(i, j, password_lower[i:j + 1],
+                      ranked_dict[password_lower[i:j + 1]])
+                     for i in range(length)
+                     for j in range(i, min(length, i + max_word_length))
+                     if password_lower[i:j + 1] in ranked_dict]
+
+        for i, j, word, rank in found:
+            matches.append({
+                'pattern': 'dictionary',
+                'i': i,
+                'j': j,
+                'token': password[i:j + 1],
+                'matched_word': word,
+                'rank': rank,
+                'dictionary_name': dictionary_name,
+                'reversed': False,
+                'l33t': False,
+            })
 
-    return sorted(matches, key=lambda x: (x['i'], x['j']))
+    return sorted(matches, key=itemgetter('i', 'j'))
 
 @ensure_ranked_dictionaries
 def reverse_dictionary_match(password,
@@ -154,7 +245,7 @@ def reverse_dictionary_match(password,
         match['i'], match['j'] = len(password) - 1 - match['j'], \
                                  len(password) - 1 - match['i']
 
-    return sorted(matches, key=lambda x: (x['i'], x['j']))
+    return sorted(matches, key=itemgetter('i', 'j'))
 
 
 def relevant_l33t_subtable(password, table):
@@ -248,7 +339,9 @@ def l33t_match(password, _ranked_dictionaries=None,
         if not len(sub):
             break
 
-        subbed_password = translate(password, sub)
+        # sub maps single l33t characters to letters, so it can be used as
+        # a translation table as is: one C-level pass over the password
+        subbed_password = password.translate(str.maketrans(sub))
         for match in dictionary_match(subbed_password, _ranked_dictionaries=_ranked_dictionaries):
             token = password[match['i']:match['j'] + 1]
             if token.lower() == match['matched_word']:
@@ -270,20 +363,22 @@ def l33t_match(password, _ranked_dictionaries=None,
 
     matches = [match for match in matches if len(match['token']) > 1]
 
-    return sorted(matches, key=lambda x: (x['i'], x['j']))
+    return sorted(matches, key=itemgetter('i', 'j'))
 
 
 # repeats (aaa, abcabcabc) and sequences (abcdef)
+GREEDY_REPEAT_RX = re.compile(r'(.+)\1+')
+LAZY_REPEAT_RX = re.compile(r'(.+?)\1+')
+LAZY_ANCHORED_REPEAT_RX = re.compile(r'^(.+?)\1+$')
+
+
 @ensure_ranked_dictionaries
 def repeat_match(password, _ranked_dictionaries=None):
     matches = []
-    greedy = re.compile(r'(.+)\1+')
-    lazy = re.compile(r'(.+?)\1+')
-    lazy_anchored = re.compile(r'^(.+?)\1+$')
     last_index = 0
     while last_index < len(password):
-        greedy_match = greedy.search(password, pos=last_index)
-        lazy_match = lazy.search(password, pos=last_index)
+        greedy_match = GREEDY_REPEAT_RX.search(password, pos=last_index)
+        lazy_match = LAZY_REPEAT_RX.search(password, pos=last_index)
 
         if not greedy_match:
             break
@@ -297,7 +392,7 @@ def repeat_match(password, _ranked_dictionaries=None):
             # aabaab in aabaabaabaab.
             # run an anchored lazy match on greedy's repeated string
             # to find the shortest repeated string
-            base_token = lazy_anchored.search(match.group(0)).group(1)
+            base_token = LAZY_ANCHORED_REPEAT_RX.search(match.group(0)).group(1)
         else:
             match = lazy_match
             base_token = match.group(1)
@@ -307,7 +402,7 @@ def repeat_match(password, _ranked_dictionaries=None):
         # recursively match and score the base string
         base_analysis = most_guessable_match_sequence(
             base_token,
-            omnimatch(base_token)
+            omnimatch(base_token, _ranked_dictionaries=_ranked_dictionaries)
         )
         base_matches = base_analysis['sequence']
         base_guesses = base_analysis['guesses']
@@ -332,7 +427,7 @@ def spatial_match(password, _graphs=GRAPHS, _ranked_dictionaries=None):
     for graph_name, graph in _graphs.items():
         matches.extend(spatial_match_helper(password, graph, graph_name))
 
-    return sorted(matches, key=lambda x: (x['i'], x['j']))
+    return sorted(matches, key=itemgetter('i', 'j'))
 
 
 SHIFTED_RX = re.compile(r'[~!@#$%^&*()_+QWERTYUIOP{}|ASDFGHJKL:"ZXCVBNM<>?]')
@@ -406,6 +501,9 @@ def spatial_match_helper(password, graph, graph_name):
 
 
 MAX_DELTA = 5
+LOWER_SEQUENCE_RX = re.compile(r'^[a-z]+$')
+UPPER_SEQUENCE_RX = re.compile(r'^[A-Z]+$')
+DIGITS_SEQUENCE_RX = re.compile(r'^\d+$')
 
 
 @ensure_ranked_dictionaries
@@ -429,13 +527,13 @@ def sequence_match(password, _ranked_dictionaries=None):
         if j - i > 1 or (delta and abs(delta) == 1):
             if 0 < abs(delta) <= MAX_DELTA:
                 token = password[i:j + 1]
-                if re.compile(r'^[a-z]+$').match(token):
+                if LOWER_SEQUENCE_RX.match(token):
                     sequence_name = 'lower'
                     sequence_space = 26
-                elif re.compile(r'^[A-Z]+$').match(token):
+                elif UPPER_SEQUENCE_RX.match(token):
                     sequence_name = 'upper'
                     sequence_space = 26
-                elif re.compile(r'^\d+$').match(token):
+                elif DIGITS_SEQUENCE_RX.match(token):
                     sequence_name = 'digits'
                     sequence_space = 10
                 else:
@@ -484,7 +582,13 @@ def regex_match(password, _regexen=REGEXEN, _ranked_dictionaries=None):
                 'regex_match': rx_match,
             })
 
-    return sorted(matches, key=lambda x: (x['i'], x['j']))
+    return sorted(matches, key=itemgetter('i', 'j'))
+
+
+MAYBE_DATE_NO_SEPARATOR_RX = re.compile(r'^\d{4,8}$')
+MAYBE_DATE_WITH_SEPARATOR_RX = re.compile(
+    r'^(\d{1,4})([\s/\\_.-])(\d{1,2})\2(\d{1,4})$'
+)
 
 
 @ensure_ranked_dictionaries
@@ -508,10 +612,6 @@ def date_match(password, _ranked_dictionaries=None):
     # this uses a ^...$ regex against every substring of the password -- less performant but leads
     # to every possible date match.
     matches = []
-    maybe_date_no_separator = re.compile(r'^\d{4,8}$')
-    maybe_date_with_separator = re.compile(
-        r'^(\d{1,4})([\s/\\_.-])(\d{1,2})\2(\d{1,4})$'
-    )
 
     # dates without separators are between length 4 '1191' and 8 '11111991'
     for i in range(len(password) - 3):
@@ -520,7 +620,7 @@ def date_match(password, _ranked_dictionaries=None):
                 break
 
             token = password[i:j + 1]
-            if not maybe_date_no_separator.match(token):
+            if not MAYBE_DATE_NO_SEPARATOR_RX.match(token):
                 continue
             candidates = []
             for k, l in DATE_SPLITS[len(token)]:
@@ -566,7 +666,7 @@ def date_match(password, _ranked_dictionaries=None):
             if j >= len(password):
                 break
             token = password[i:j + 1]
-            rx_match = maybe_date_with_separator.match(token)
+            rx_match = MAYBE_DATE_WITH_SEPARATOR_RX.match(token)
             if not rx_match:
                 continue
             dmy = map_ints_to_dmy([
@@ -606,7 +706,7 @@ def date_match(password, _ranked_dictionaries=None):
                 break
         return not is_submatch
 
-    return sorted(filter(filter_fun, matches), key=lambda x: (x['i'], x['j']))
+    return sorted(filter(filter_fun, matches), key=itemgetter('i', 'j'))
 
 
 def map_ints_to_dmy(ints):
@@ -1,5 +1,6 @@
 from math import log, factorial
 
+import functools
 import re
 
 from .adjacency_graphs import ADJACENCY_GRAPHS
@@ -26,6 +27,9 @@ MIN_YEAR_SPACE = 20
 REFERENCE_YEAR = 2017
 
 
+# memoized: the guess estimators call this repeatedly with the same small
+# arguments, e.g. once per (length, turns) pair for every spatial match.
+@functools.lru_cache(maxsize=4096)
 def nCk(n, k):
     """http://blog.plover.com/math/choose.html"""
     if k > n:
@@ -142,14 +146,13 @@ def most_guessable_match_sequence(password, matches, _exclude_additive=False):
         # see if a single bruteforce match spanning the k-prefix is optimal.
         m = make_bruteforce_match(0, k)
         update(m, 1)
+        optimal_m = optimal['m']
         for i in range(1, k + 1):
             # generate k bruteforce matches, spanning from (i=1, j=k) up to
             # (i=k, j=k). see if adding these new matches to any of the
             # sequences in optimal[i-1] leads to new bests.
-            m = make_bruteforce_match(i, k)
-            for l, last_m in optimal['m'][i - 1].items():
-                l = int(l)
-
+            m = None
+            for l, last_m in optimal_m[i - 1].items():
                 # corner: an optimal sequence will never have two adjacent
                 # bruteforce matches. it is strictly better to have a single
                 # bruteforce match spanning the same region: same contribution
@@ -158,6 +161,11 @@ def most_guessable_match_sequence(password, matches, _exclude_additive=False):
                 if last_m.get('pattern', False) == 'bruteforce':
                     continue
 
+                # only build (and estimate) the match when it can extend a
+                # sequence: most prefixes end in a bruteforce match.
+                if m is None:
+                    m = make_bruteforce_match(i, k)
+
                 # try adding m to this length-l sequence.
                 update(m, l + 1)
 
@@ -199,7 +207,6 @@ def most_guessable_match_sequence(password, matches, _exclude_additive=False):
         for m in matches_by_j[k]:
             if m['i'] > 0:
                 for l in optimal['m'][m['i'] - 1]:
-                    l = int(l)
                     update(m, l + 1)
             else:
                 update(m, 1)
@@ -279,13 +286,16 @@ def repeat_guesses(match):
     return match['base_guesses'] * Decimal(match['repeat_count'])
 
 
+DIGIT_RX = re.compile(r'\d')
+
+
 def sequence_guesses(match):
     first_chr = match['token'][:1]
     # lower guesses for obvious starting points
     if first_chr in ['a', 'A', 'z', 'Z', '0', '1', '9']:
         base_guesses = 4
     else:
-        if re.compile(r'\d').match(first_chr):
+        if DIGIT_RX.match(first_chr):
             base_guesses = 10  # digits
         else:
             # could give a higher base for uppercase,
@@ -0,0 +1,104 @@
+import os
+import gettext
+import logging
+import threading
+
+_log = logging.getLogger(__name__)
+
+LOCALE_DIR = os.path.join(os.path.dirname(__file__), 'locale')
+DOMAIN = 'messages'
+
+# Shared by every language without a catalog (including 'en'), so switching
+# between them doesn't re-install anything.
+_NULL_TRANSLATION = gettext.NullTranslations()
+
+# {lang_code: translation}, see get_translation(). Codes naming a shipped
+# catalog are always kept (there's one per .mo file); any other code only
+# while there's room, since lang may come straight from a request. Codes
+# beyond the limit are looked up each time.
+_TRANSLATION_CACHE: dict = {}
+_TRANSLATION_CACHE_SIZE = 32
+_CACHE_LOCK = threading.Lock()
+
+# Spellings that resolve to the same catalog, keyed by lowercase code with '_'
+# separators. Canonicalizing them up front lets them share one cache entry,
+# and switching between them doesn't re-install the translation.
+_LANG_ALIASES = {
+    '': 'en',
+    'en_us': 'en',
+    'zh': 'zh_CN',
+    'zh_cn': 'zh_CN',
+    'zh_hans': 'zh_CN',
+    'zh_hans_cn': 'zh_CN',
+}
+
+# Catalogs tried after the requested one for any Chinese variant
+_ZH_FALLBACK = ('zh_CN', 'zh')
+
+
+def canonical_lang(lang_code):
+    """Return the code shared by every alias of lang_code's catalog."""
+    return _LANG_ALIASES.get(lang_code.replace('-', '_').lower(), lang_code)
+
+
+def get_translation(lang_code):
+    """Load the gettext translation for the given language code.
+
+    Cached per language code, so the locale directory is searched and the
+    catalog parsed only once rather than on every zxcvbn() call.
+    """
+    lang_code = canonical_lang(lang_code)
+
+    # the messages are written in English, there's no catalog to look for
+    if lang_code == 'en':
+        return _NULL_TRANSLATION
+
+    translation = _TRANSLATION_CACHE.get(lang_code)
+    if translation is not None:
+        return translation
+
+    # double-checked so concurrent first calls share a single load
+    with _CACHE_LOCK:
+        translation = _TRANSLATION_CACHE.get(lang_code)
+        if translation is None:
+            translation = _find_translation(lang_code)
+            if (len(_TRANSLATION_CACHE) < _TRANSLATION_CACHE_SIZE
+                    or _has_catalog(lang_code)):
+                _TRANSLATION_CACHE[lang_code] = translation
+
+    return translation
+
+
+def _has_catalog(lang_code):
+    return os.path.exists(
+        os.path.join(LOCALE_DIR, lang_code, 'LC_MESSAGES', DOMAIN + '.mo'))
+
+
+def _find_translation(lang_code):
+    """Search the locale directory for the given language code's catalog."""
+    # 1. Core logic for implementing locale aliasing
+    if lang_code.lower().startswith('zh'):
+        # For any Chinese variants, build a fallback chain
+        # For example, if lang_code is 'zh_TW', it will be
+        # ('zh_TW', 'zh_CN', 'zh'): gettext will first look for 'zh_TW', then
+        # fall back to 'zh_CN'
+        languages_to_try = (lang_code,) + tuple(
+            code for code in _ZH_FALLBACK if code != lang_code)
+    else:
+        # For other languages, use directly
+        languages_to_try = (lang_code,)
+
+    _log.debug("Attempting to load translations for '%s'. Search path: %s",
+               lang_code, languages_to_try)
+
+    # 2. Pass our constructed language list to gettext
+    translation = gettext.translation(
+        DOMAIN,
+        localedir=LOCALE_DIR,
+        languages=languages_to_try,
+        fallback=True # fallback=True ensures no exception if all languages not found
+    )
+
+    if type(translation) is gettext.NullTranslations:
+        return _NULL_TRANSLATION
+    return translation